@@ -10,7 +10,6 @@ import time
 import signal
 import threading
 from pathlib import Path
-from datetime import datetime, timedelta
 from typing import Dict, Optional
 import argparse
 
@@ -35,7 +34,9 @@ class VibeAutoSave:
         self.save_interval = save_interval
         self.branch_threshold = branch_threshold
         self.running = False
-        self.last_save_time = datetime.now()
+        # Scheduling uses monotonic seconds; wall-clock time is only for display
+        self.last_save_time = time.monotonic()
+        self.last_convergence_check = time.monotonic()
         self.last_file_check = {}
         
         # Initialize the brancher
@@ -58,15 +59,17 @@ class VibeAutoSave:
     def _get_file_modification_times(self) -> Dict[str, float]:
         """Get modification times for all tracked files."""
         try:
-            # Get list of tracked files
-            result = self.brancher._run_git_command(['ls-files'])
+            # Get list of tracked files (NUL-separated, so paths need no unquoting)
+            result = self.brancher._run_git_command(['ls-files', '-z'])
             files = {}
             
-            for file_path in result.split('\n'):
-                if file_path.strip():
-                    full_path = os.path.join(self.brancher.repo_path, file_path)
-                    if os.path.exists(full_path):
-                        files[file_path] = os.path.getmtime(full_path)
+            for file_path in result.split('\0'):
+                if file_path:
+                    # One stat per file; deleted files simply drop out
+                    try:
+                        files[file_path] = os.stat(os.path.join(self.brancher.repo_path, file_path)).st_mtime
+                    except OSError:
+                        continue
             
             return files
         except Exception:
@@ -80,44 +83,48 @@ class VibeAutoSave:
             self.last_file_check = current_files
             return False
         
-        # Check if any files have been modified
-        for file_path, mtime in current_files.items():
-            if file_path not in self.last_file_check or self.last_file_check[file_path] != mtime:
-                self.last_file_check = current_files
-                return True
+        # Nothing was touched since last tick (the common case); dict equality runs in C
+        if current_files == self.last_file_check:
+            return False
         
-        return False
+        # Check if any files have been modified
+        changed = any(self.last_file_check.get(file_path) != mtime
+                      for file_path, mtime in current_files.items())
+        self.last_file_check = current_files
+        return changed
     
     def _should_auto_save(self) -> bool:
         """Determine if it's time for an automatic save."""
-        time_since_last = datetime.now() - self.last_save_time
-        return time_since_last.total_seconds() >= self.save_interval
+        return time.monotonic() - self.last_save_time >= self.save_interval
     
     def _invisible_save(self):
         """Perform completely invisible save."""
         try:
-            # Check if there are any changes
-            files = self.brancher._get_git_status()
-            total_files = len(files['modified']) + len(files['added']) + len(files['untracked'])
-            
-            if total_files == 0:
-                return
-            
-            # Check if we should auto-save based on time
+            # Check if we should auto-save based on time (no git calls needed)
             if not self._should_auto_save():
                 return
             
-            # Run vibe analysis to see if we should branch
+            # Run vibe analysis once; its file list tells us if there are changes
             analysis = self.brancher.analyze_branch_need()
+            files = analysis['files']
+            total_files = files['total_files']
+            
+            if total_files == 0:
+                return
             
             # If branch score is high, auto-branch silently
-            if analysis['branch_score'] >= self.branch_threshold:
-                self.brancher.auto_branch_if_needed(silent=True)
+            tried_branch = analysis['branch_score'] >= self.branch_threshold and analysis['should_branch']
+            if tried_branch:
+                branch_name = self.brancher.suggest_branch_name(analysis)
+                self.brancher.create_branch(branch_name, silent=True)
             
-            # Perform automatic save (completely silent)
-            success = self.brancher.save_progress(silent=True)
+            # Perform automatic save (completely silent), reusing the analysis; below
+            # the threshold save_progress still branches whenever should_branch is set,
+            # but a name that just failed is not retried
+            success = self.brancher.save_progress(silent=True, analysis=analysis,
+                                                  auto_branch=not tried_branch)
             if success:
-                self.last_save_time = datetime.now()
+                self.last_save_time = time.monotonic()
                 # No output - completely invisible
             
         except Exception:
@@ -128,11 +135,7 @@ class VibeAutoSave:
         """Check if current branch is ready to merge (invisible)."""
         try:
             # Only check convergence every 5 minutes to avoid overhead
-            if not hasattr(self, 'last_convergence_check'):
-                self.last_convergence_check = datetime.now()
-            
-            time_since_check = datetime.now() - self.last_convergence_check
-            if time_since_check.total_seconds() < 300:  # 5 minutes
+            if time.monotonic() - self.last_convergence_check < 300:  # 5 minutes
                 return
             
             # Run convergence analysis
@@ -144,7 +147,7 @@ class VibeAutoSave:
                 strategy = self.brancher.suggest_merge_strategy()
                 print(f"   Suggested: {strategy}")
             
-            self.last_convergence_check = datetime.now()
+            self.last_convergence_check = time.monotonic()
             
         except Exception:
             # Silent failure
@@ -10,194 +10,434 @@ Analyzes your changes and suggests when to create a new branch based on:
 """
 
 import os
+import re
 import sys
 import subprocess
 import json
+import functools
 import time
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from pathlib import Path
+from itertools import chain
 from typing import Dict, List, Tuple, Optional
 import argparse
 
+try:
+    import pygit2
+    # Repository.status(untracked_files=...) needs pygit2 1.14 or newer
+    if tuple(int(part) for part in pygit2.__version__.split('.')[:2]) < (1, 14):
+        pygit2 = None
+except ImportError:
+    pygit2 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Built once at import; instances copy the top level and never mutate nested sections
+_DEFAULT_CONFIG = {
+    "thresholds": {
+        "files_changed": 5,
+        "lines_added": 50,
+        "lines_removed": 30,
+        "time_minutes": 30,
+        "complexity_score": 7
+    },
+    "weights": {
+        "files_changed": 0.3,
+        "lines_changed": 0.25,
+        "time_factor": 0.2,
+        "complexity": 0.15,
+        "file_types": 0.1
+    },
+    "file_type_weights": {
+        ".py": 1.0, ".js": 0.8, ".ts": 0.9, ".java": 1.0,
+        ".cpp": 1.0, ".c": 1.0, ".go": 1.0, ".rs": 1.0,
+        ".html": 0.3, ".css": 0.3, ".json": 0.2,
+        ".md": 0.1, ".txt": 0.1
+    },
+    "branch_naming": {
+        "prefix": "feature",
+        "separator": "/",
+        "include_timestamp": False
+    },
+    "include_untracked": True
+}
+
+# Read-only queries that together describe the working tree for one analysis
+_GIT_SNAPSHOT_COMMANDS = {
+    'status': ['status', '--porcelain=v2', '-z'],
+    'staged_diff': ['diff', '--cached', '--shortstat'],
+    'unstaged_diff': ['diff', '--shortstat'],
+    'last_commit': ['log', '-1', '--format=%ct'],
+}
+
+# Git runs without optional locks so background status reads never hold index.lock;
+# otherwise in the user's own environment, so hooks and error messages stay localised
+_GIT_ENV = dict(os.environ, GIT_OPTIONAL_LOCKS='0')
+
+# Read-only queries whose output gets parsed run untranslated, so summary lines
+# such as --shortstat parse the same everywhere
+_GIT_QUERY_ENV = dict(_GIT_ENV, LC_ALL='C')
+
+# Totals line of `git diff --shortstat`; binary files count as changed files only
+_SHORTSTAT_RE = re.compile(
+    r'(\d+) files? changed(?:, (\d+) insertions?\(\+\))?(?:, (\d+) deletions?\(-\))?'
+)
+
+# Change buckets in the dict returned by _get_git_status
+_STATUS_BUCKETS = ('modified', 'added', 'deleted', 'renamed', 'untracked')
+
+# Porcelain status letter -> bucket in the dict returned by _get_git_status
+_STATUS_INDEX = {'M': 'modified', 'A': 'added', 'D': 'deleted', 'R': 'renamed', 'C': 'modified'}
+
+# Characters in file names that become dashes in suggested branch names
+_BRANCH_NAME_TRANS = str.maketrans('_ ', '--')
+
+# Porcelain v2 record type -> index of the path among its space-separated fields
+_PORCELAIN_V2_PATH_FIELD = {'1': 8, '2': 9, 'u': 10}
+
+# Git's well-known empty tree; libgit2 resolves it without it being in the object store
+_EMPTY_TREE_ID = '4b825dc642cb6eb9a060e54bf8d69288fbee4904'
+
+if pygit2 is not None:
+    # Worktree status flags -> bucket, for files whose index entry is unchanged
+    _PYGIT2_WORKTREE_BUCKETS = (
+        (pygit2.GIT_STATUS_WT_MODIFIED, 'modified'),
+        (pygit2.GIT_STATUS_WT_DELETED, 'deleted'),
+        (pygit2.GIT_STATUS_WT_NEW, 'untracked'),
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> Dict:
+    """Parse a JSON config file; cached until the file's mtime or size changes."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+@functools.lru_cache(maxsize=8)
+def _find_repo_root(cwd: str) -> str:
+    """Find the root of the git repository containing cwd; cached per directory."""
+    if pygit2 is not None:
+        git_dir = pygit2.discover_repository(cwd)
+        workdir = pygit2.Repository(git_dir).workdir if git_dir else None
+        if not workdir:
+            raise RuntimeError("Not in a git repository")
+        return os.path.normpath(workdir)
+    
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--show-toplevel'],
+            cwd=cwd,
+            env=_GIT_ENV,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        return result.stdout.strip()
+    except subprocess.CalledProcessError:
+        raise RuntimeError("Not in a git repository")
+
+
+def _decode_git_output(command: List[str], stdout: bytes) -> str:
+    """Decode git output like file names (surrogateescape) so any path git prints survives.
+    
+    NUL-delimited (-z) output is returned verbatim: stripping it would eat
+    leading or trailing spaces that belong to the first or last path.
+    """
+    output = os.fsdecode(stdout)
+    return output if '-z' in command else output.strip()
+
+
+def _empty_diff_stats() -> Dict:
+    """Zeroed staged/unstaged diff statistics."""
+    return {
+        'staged': {'files': 0, 'insertions': 0, 'deletions': 0},
+        'unstaged': {'files': 0, 'insertions': 0, 'deletions': 0}
+    }
+
+
+def _stem(path: str) -> str:
+    """File name without directory or last extension (Path.stem without the Path object)."""
+    return os.path.splitext(os.path.basename(path.rstrip('/')))[0]
+
+
+def _weighted_score(factors: Tuple[float, ...], weights: Tuple[float, ...]) -> float:
+    """Combine normalized factors into a single score (dot product with the weights)."""
+    score = 0.0
+    for factor, weight in zip(factors, weights):
+        score += factor * weight
+    return score
+
 
 class GitVibeBrancher:
     def __init__(self, config_path: Optional[str] = None):
         self.config = self._load_config(config_path)
+        
+        # Thresholds and weights are fixed once loaded; resolve them here instead of per analysis
+        thresholds = self.config['thresholds']
+        self._thr_files = thresholds['files_changed']
+        self._thr_lines_total = thresholds['lines_added'] + thresholds['lines_removed']
+        self._thr_time = thresholds['time_minutes']
+        self._thr_complexity = thresholds['complexity_score']
+        weights = self.config['weights']
+        self._score_weights = (weights['files_changed'], weights['lines_changed'], weights['time_factor'],
+                               weights['complexity'], weights['file_types'])
+        
+        # Leaving out untracked files spares git a walk of the whole working tree
+        self._include_untracked = self.config['include_untracked']
+        self._snapshot_commands = dict(_GIT_SNAPSHOT_COMMANDS)
+        if not self._include_untracked:
+            self._snapshot_commands['status'] = _GIT_SNAPSHOT_COMMANDS['status'] + ['--untracked-files=no']
+        
         self.repo_path = self._find_git_repo()
+        self._git_snapshot = None
+    
+    @property
+    def repo_path(self) -> str:
+        return self._repo_path
+    
+    @repo_path.setter
+    def repo_path(self, path: str):
+        # Keep the in-process pygit2 handle pointed at the same repository
+        self._repo_path = path
+        self._repo = pygit2.Repository(path) if pygit2 is not None else None
         
     def _load_config(self, config_path: Optional[str]) -> Dict:
         """Load configuration from file or use defaults."""
-        default_config = {
-            "thresholds": {
-                "files_changed": 5,
-                "lines_added": 50,
-                "lines_removed": 30,
-                "time_minutes": 30,
-                "complexity_score": 7
-            },
-            "weights": {
-                "files_changed": 0.3,
-                "lines_changed": 0.25,
-                "time_factor": 0.2,
-                "complexity": 0.15,
-                "file_types": 0.1
-            },
-            "file_type_weights": {
-                ".py": 1.0, ".js": 0.8, ".ts": 0.9, ".java": 1.0,
-                ".cpp": 1.0, ".c": 1.0, ".go": 1.0, ".rs": 1.0,
-                ".html": 0.3, ".css": 0.3, ".json": 0.2,
-                ".md": 0.1, ".txt": 0.1
-            },
-            "branch_naming": {
-                "prefix": "feature",
-                "separator": "/",
-                "include_timestamp": False
-            }
-        }
+        config = dict(_DEFAULT_CONFIG)
         
         if config_path and os.path.exists(config_path):
             try:
-                with open(config_path, 'r') as f:
-                    user_config = json.load(f)
-                    default_config.update(user_config)
+                stat = os.stat(config_path)
+                user_config = _read_config_file(os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size)
+                # Merge each section over its defaults, so a file can override
+                # just the keys it cares about (e.g. one threshold)
+                for key, value in user_config.items():
+                    default = config.get(key)
+                    if isinstance(default, dict) and isinstance(value, dict):
+                        config[key] = {**default, **value}
+                    else:
+                        config[key] = value
             except (json.JSONDecodeError, IOError) as e:
                 print(f"Warning: Could not load config from {config_path}: {e}")
                 
-        return default_config
+        return config
     
     def _find_git_repo(self) -> str:
         """Find the git repository root."""
-        current_dir = os.getcwd()
-        while current_dir != '/':
-            if os.path.exists(os.path.join(current_dir, '.git')):
-                return current_dir
-            current_dir = os.path.dirname(current_dir)
-        raise RuntimeError("Not in a git repository")
+        return _find_repo_root(os.getcwd())
     
-    def _run_git_command(self, command: List[str]) -> str:
+    def _run_git_command(self, command: List[str], env: Dict[str, str] = _GIT_ENV) -> str:
         """Run a git command and return the output."""
         try:
             result = subprocess.run(
                 ['git'] + command,
                 cwd=self.repo_path,
+                env=env,
                 capture_output=True,
-                text=True,
                 check=True
             )
-            return result.stdout.strip()
+            return _decode_git_output(command, result.stdout)
         except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Git command failed: {' '.join(command)}\nError: {e.stderr}")
+            raise RuntimeError(f"Git command failed: {' '.join(command)}\nError: {os.fsdecode(e.stderr)}")
+    
+    def _run_git_commands_parallel(self, commands: List[List[str]],
+                                   env: Dict[str, str] = _GIT_QUERY_ENV) -> List[Optional[str]]:
+        """Run independent git commands concurrently.
+        
+        Returns one output per command, or None for commands that failed.
+        """
+        # Start every process before waiting on any, so the spawns overlap
+        processes = [
+            subprocess.Popen(
+                ['git'] + command,
+                cwd=self.repo_path,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            for command in commands
+        ]
+        
+        outputs = []
+        for command, process in zip(commands, processes):
+            stdout, _ = process.communicate()
+            outputs.append(_decode_git_output(command, stdout) if process.returncode == 0 else None)
+        return outputs
+    
+    @contextmanager
+    def _git_snapshot_scope(self, keys: Tuple[str, ...] = tuple(_GIT_SNAPSHOT_COMMANDS)):
+        """Serve the given status/diff/log queries from one parallel git run while active."""
+        if self._git_snapshot is not None or self._repo is not None:
+            yield
+            return
+        
+        outputs = self._run_git_commands_parallel([self._snapshot_commands[key] for key in keys])
+        self._git_snapshot = dict(zip(keys, outputs))
+        try:
+            yield
+        finally:
+            self._git_snapshot = None
+    
+    def _read_git(self, key: str) -> str:
+        """Get the output of a snapshot query, using the active snapshot if any."""
+        command = self._snapshot_commands[key]
+        if self._git_snapshot is None:
+            return self._run_git_command(command, env=_GIT_QUERY_ENV)
+        
+        output = self._git_snapshot[key]
+        if output is None:
+            raise RuntimeError(f"Git command failed: {' '.join(command)}")
+        return output
+    
+    def _get_staged_diff(self):
+        """Diff HEAD (or the empty tree when unborn) to the index, with renames detected like git does."""
+        repo = self._repo
+        repo.index.read(False)
+        if repo.head_is_unborn:
+            tree = repo.get(_EMPTY_TREE_ID)
+        else:
+            tree = repo.head.peel(pygit2.Tree)
+        diff = repo.index.diff_to_tree(tree)
+        diff.find_similar(pygit2.GIT_DIFF_FIND_RENAMES)
+        return diff
     
     def _get_git_status(self) -> Dict:
         """Get current git status information."""
-        status_output = self._run_git_command(['status', '--porcelain'])
-        
-        files = {
-            'modified': [],
-            'added': [],
-            'deleted': [],
-            'renamed': [],
-            'untracked': []
-        }
-        
-        for line in status_output.split('\n'):
-            if not line:
-                continue
-                
-            status = line[:2]
-            filename = line[3:]
+        return self._get_status_and_staged_diff()[0]
+    
+    def _get_status_and_staged_diff(self) -> Tuple[Dict, Optional[object]]:
+        """Get git status, plus the pygit2 staged diff it was read from.
+        
+        The diff is None with the git CLI and on a clean tree, where it is never built.
+        """
+        files = {bucket: [] for bucket in _STATUS_BUCKETS}
+        staged_diff = None
+        
+        untracked_files = 'normal' if self._include_untracked else 'no'
+        status = self._repo.status(untracked_files=untracked_files) if self._repo is not None else None
+        if status:
+            # Index status takes precedence and comes from the rename-aware staged diff,
+            # which libgit2's status list does not apply rename detection to
+            staged_diff = self._get_staged_diff()
+            staged_paths = set()
+            for delta in staged_diff.deltas:
+                bucket = _STATUS_INDEX.get(delta.status_char())
+                if bucket:
+                    files[bucket].append(delta.new_file.path)
+                    staged_paths.update((delta.old_file.path, delta.new_file.path))
             
-            if status[0] in 'MADRC':
-                if status[0] == 'M':
-                    files['modified'].append(filename)
-                elif status[0] == 'A':
-                    files['added'].append(filename)
-                elif status[0] == 'D':
-                    files['deleted'].append(filename)
-                elif status[0] == 'R':
-                    files['renamed'].append(filename)
-                elif status[0] == 'C':
-                    files['modified'].append(filename)
-            elif status[1] in 'MADRC':
-                if status[1] == 'M':
-                    files['modified'].append(filename)
-                elif status[1] == 'A':
-                    files['added'].append(filename)
-                elif status[1] == 'D':
-                    files['deleted'].append(filename)
-            elif status == '??':
-                files['untracked'].append(filename)
-        
-        return files
-    
-    def _get_diff_stats(self) -> Dict:
+            for filename, flags in status.items():
+                if filename in staged_paths:
+                    continue
+                for flag, bucket in _PYGIT2_WORKTREE_BUCKETS:
+                    if flags & flag:
+                        files[bucket].append(filename)
+                        break
+            
+            # Porcelain output is sorted by path
+            for bucket in _STATUS_BUCKETS:
+                files[bucket].sort()
+        elif self._repo is None:
+            # NUL-separated records keep paths verbatim (no quoting, spaces or newlines intact)
+            records = iter(self._read_git('status').split('\0'))
+            for record in records:
+                kind = record[:1]
+                if kind == '?':
+                    files['untracked'].append(record[2:])
+                    continue
+                
+                path_field = _PORCELAIN_V2_PATH_FIELD.get(kind)
+                if path_field is None:
+                    continue
+                filename = record.split(' ', path_field)[path_field]
+                if kind == '2':
+                    # Renames and copies are followed by a record holding the original path
+                    next(records, None)
+                
+                # Index status takes precedence over worktree status
+                bucket = _STATUS_INDEX.get(record[2]) or _STATUS_INDEX.get(record[3])
+                if bucket:
+                    files[bucket].append(filename)
+        
+        # Files that count as changes everywhere else (deletions and renames do not)
+        files['total_files'] = len(files['modified']) + len(files['added']) + len(files['untracked'])
+        return files, staged_diff
+    
+    def _get_diff_stats(self, staged_diff=None) -> Dict:
         """Get diff statistics for staged and unstaged changes."""
-        stats = {
-            'staged': {'files': 0, 'insertions': 0, 'deletions': 0},
-            'unstaged': {'files': 0, 'insertions': 0, 'deletions': 0}
-        }
-        
-        # Get staged changes
-        try:
-            staged_output = self._run_git_command(['diff', '--cached', '--numstat'])
-            if staged_output:
-                for line in staged_output.split('\n'):
-                    if line:
-                        parts = line.split('\t')
-                        if len(parts) >= 3:
-                            stats['staged']['files'] += 1
-                            if parts[0] != '-':
-                                stats['staged']['insertions'] += int(parts[0])
-                            if parts[1] != '-':
-                                stats['staged']['deletions'] += int(parts[1])
-        except RuntimeError:
-            pass
-        
-        # Get unstaged changes
-        try:
-            unstaged_output = self._run_git_command(['diff', '--numstat'])
-            if unstaged_output:
-                for line in unstaged_output.split('\n'):
-                    if line:
-                        parts = line.split('\t')
-                        if len(parts) >= 3:
-                            stats['unstaged']['files'] += 1
-                            if parts[0] != '-':
-                                stats['unstaged']['insertions'] += int(parts[0])
-                            if parts[1] != '-':
-                                stats['unstaged']['deletions'] += int(parts[1])
-        except RuntimeError:
-            pass
+        stats = _empty_diff_stats()
+        
+        if self._repo is not None:
+            if staged_diff is None:
+                staged_diff = self._get_staged_diff()
+            diffs = {'staged': staged_diff, 'unstaged': self._repo.diff()}
+            for key, diff in diffs.items():
+                diff_stats = diff.stats
+                stats[key] = {
+                    'files': diff_stats.files_changed,
+                    'insertions': diff_stats.insertions,
+                    'deletions': diff_stats.deletions
+                }
+            return stats
+        
+        # Get staged and unstaged changes
+        for key, snapshot_key in (('staged', 'staged_diff'), ('unstaged', 'unstaged_diff')):
+            try:
+                self._parse_shortstat(self._read_git(snapshot_key), stats[key])
+            except RuntimeError:
+                pass
         
         return stats
     
-    def _get_last_commit_time(self) -> Optional[datetime]:
-        """Get the timestamp of the last commit."""
+    def _parse_shortstat(self, output: str, bucket: Dict):
+        """Fill a files/insertions/deletions bucket from `git diff --shortstat` output."""
+        match = _SHORTSTAT_RE.search(output)
+        if match:
+            files, insertions, deletions = match.groups()
+            bucket['files'] = int(files)
+            bucket['insertions'] = int(insertions or 0)
+            bucket['deletions'] = int(deletions or 0)
+    
+    def _get_last_commit_time(self) -> Optional[int]:
+        """Get the unix timestamp of the last commit."""
+        if self._repo is not None:
+            if self._repo.head_is_unborn:
+                return None
+            return self._repo[self._repo.head.target].commit_time
+        
         try:
-            timestamp_str = self._run_git_command(['log', '-1', '--format=%ct'])
+            timestamp_str = self._read_git('last_commit')
             if timestamp_str:
-                return datetime.fromtimestamp(int(timestamp_str))
+                return int(timestamp_str)
         except RuntimeError:
             pass
         return None
     
     def _calculate_file_type_complexity(self, files: Dict) -> float:
         """Calculate complexity based on file types being modified."""
-        all_files = files['modified'] + files['added'] + files['untracked']
-        if not all_files:
+        # Untracked directories are reported with a trailing slash
+        extensions = Counter(
+            os.path.splitext(filename.rstrip('/'))[1].lower()
+            for filename in chain(files['modified'], files['added'], files['untracked'])
+        )
+        if not extensions:
             return 0.0
         
-        total_weight = 0.0
-        for filename in all_files:
-            file_ext = Path(filename).suffix.lower()
-            weight = self.config['file_type_weights'].get(file_ext, 0.5)
-            total_weight += weight
-        
-        return total_weight / len(all_files)
+        weights = self.config['file_type_weights']
+        total_weight = sum(weights.get(ext, 0.5) * count for ext, count in extensions.items())
+        return total_weight / sum(extensions.values())
     
-    def _calculate_complexity_score(self, files: Dict, diff_stats: Dict) -> float:
+    def _calculate_complexity_score(self, files: Dict, diff_stats: Dict,
+                                    type_complexity: Optional[float] = None) -> float:
         """Calculate overall complexity score based on various factors."""
-        total_files = len(files['modified']) + len(files['added']) + len(files['untracked'])
+        total_files = files['total_files']
         total_insertions = diff_stats['staged']['insertions'] + diff_stats['unstaged']['insertions']
         total_deletions = diff_stats['staged']['deletions'] + diff_stats['unstaged']['deletions']
         
@@ -207,8 +447,9 @@ class GitVibeBrancher:
         # Line change complexity
         line_complexity = min((total_insertions + total_deletions) / 100.0, 1.0)
         
-        # File type complexity
-        type_complexity = self._calculate_file_type_complexity(files)
+        # File type complexity (callers that already computed it pass it in)
+        if type_complexity is None:
+            type_complexity = self._calculate_file_type_complexity(files)
         
         # Combine factors
         complexity = (
@@ -222,41 +463,58 @@ class GitVibeBrancher:
     def _calculate_time_factor(self) -> float:
         """Calculate time-based factor for branching decision."""
         last_commit = self._get_last_commit_time()
-        if not last_commit:
+        if last_commit is None:
             return 1.0  # No previous commits, high factor
         
-        time_diff = datetime.now() - last_commit
-        minutes = time_diff.total_seconds() / 60
+        minutes = (time.time() - last_commit) / 60
         
         # Linear increase with time, max at 1.0 after threshold
-        threshold = self.config['thresholds']['time_minutes']
-        return min(minutes / threshold, 1.0)
+        return min(minutes / self._thr_time, 1.0)
     
     def analyze_branch_need(self) -> Dict:
         """Analyze whether a new branch should be created."""
-        files = self._get_git_status()
-        diff_stats = self._get_diff_stats()
+        # Status alone tells whether there is anything to measure
+        files, staged_diff = self._get_status_and_staged_diff()
+        
+        if not any(files[bucket] for bucket in _STATUS_BUCKETS):
+            # Clean working tree: nothing to diff and nothing to branch for
+            return {
+                'should_branch': False,
+                'branch_score': 0.0,
+                'factors': {
+                    'files_changed': 0,
+                    'file_factor': 0.0,
+                    'lines_added': 0,
+                    'lines_removed': 0,
+                    'line_factor': 0.0,
+                    'time_factor': 0.0,
+                    'complexity_score': 0.0,
+                    'complexity_factor': 0.0
+                },
+                'files': files,
+                'diff_stats': _empty_diff_stats()
+            }
+        
+        # Only a dirty tree needs the diffs and the last commit time, fetched together
+        with self._git_snapshot_scope(('staged_diff', 'unstaged_diff', 'last_commit')):
+            diff_stats = self._get_diff_stats(staged_diff)
+            time_factor = self._calculate_time_factor()
         
         # Calculate individual factors
-        total_files = len(files['modified']) + len(files['added']) + len(files['untracked'])
+        total_files = files['total_files']
         total_insertions = diff_stats['staged']['insertions'] + diff_stats['unstaged']['insertions']
         total_deletions = diff_stats['staged']['deletions'] + diff_stats['unstaged']['deletions']
         
-        file_factor = min(total_files / self.config['thresholds']['files_changed'], 1.0)
-        line_factor = min((total_insertions + total_deletions) / 
-                         (self.config['thresholds']['lines_added'] + self.config['thresholds']['lines_removed']), 1.0)
-        time_factor = self._calculate_time_factor()
-        complexity = self._calculate_complexity_score(files, diff_stats)
-        complexity_factor = min(complexity / self.config['thresholds']['complexity_score'], 1.0)
+        file_factor = min(total_files / self._thr_files, 1.0)
+        line_factor = min((total_insertions + total_deletions) / self._thr_lines_total, 1.0)
+        type_complexity = self._calculate_file_type_complexity(files)
+        complexity = self._calculate_complexity_score(files, diff_stats, type_complexity)
+        complexity_factor = min(complexity / self._thr_complexity, 1.0)
         
         # Calculate weighted score
-        weights = self.config['weights']
-        branch_score = (
-            file_factor * weights['files_changed'] +
-            line_factor * weights['lines_changed'] +
-            time_factor * weights['time_factor'] +
-            complexity_factor * weights['complexity'] +
-            self._calculate_file_type_complexity(files) * weights['file_types']
+        branch_score = _weighted_score(
+            (file_factor, line_factor, time_factor, complexity_factor, type_complexity),
+            self._score_weights
         )
         
         should_branch = branch_score >= 0.6  # Threshold for branching
@@ -291,7 +549,7 @@ class GitVibeBrancher:
         if all_files:
             # Use the most significant file as basis for name
             main_file = all_files[0]
-            feature_name = Path(main_file).stem.lower().replace('_', '-').replace(' ', '-')
+            feature_name = _stem(main_file).lower().translate(_BRANCH_NAME_TRANS)
         else:
             feature_name = "changes"
         
@@ -306,47 +564,60 @@ class GitVibeBrancher:
     def create_branch(self, branch_name: str, silent: bool = False) -> bool:
         """Create a new git branch."""
         try:
-            # Check if branch already exists
-            existing_branches = self._run_git_command(['branch', '--list', branch_name])
-            if existing_branches:
-                if not silent:
-                    print(f"Branch '{branch_name}' already exists!")
-                return False
-            
-            # Create and checkout new branch
+            # Create and checkout new branch; git itself refuses an existing name,
+            # so no separate lookup is needed first
             self._run_git_command(['checkout', '-b', branch_name])
             if not silent:
                 print(f"✅ Created and switched to branch: {branch_name}")
             return True
         except RuntimeError as e:
             if not silent:
-                print(f"❌ Failed to create branch: {e}")
+                # git's message is localised, so ask whether the ref exists instead of matching it
+                try:
+                    self._run_git_command(['show-ref', '--verify', '--quiet', f'refs/heads/{branch_name}'])
+                    exists = True
+                except RuntimeError:
+                    exists = False
+                if exists:
+                    print(f"Branch '{branch_name}' already exists!")
+                else:
+                    print(f"❌ Failed to create branch: {e}")
             return False
     
     def auto_branch_if_needed(self, silent: bool = False) -> bool:
         """Automatically create a branch if analysis suggests it."""
-        analysis = self.analyze_branch_need()
-        
+        return self._auto_branch_from_analysis(self.analyze_branch_need(), silent=silent)
+    
+    def _auto_branch_from_analysis(self, analysis: Dict, silent: bool = False) -> bool:
+        """Create a branch if an already computed analysis suggests it."""
         if analysis['should_branch']:
             branch_name = self.suggest_branch_name(analysis)
             return self.create_branch(branch_name, silent=silent)
         
         return False
     
-    def save_progress(self, description: str = None, silent: bool = False) -> bool:
-        """Save current progress with intelligent branching."""
+    def save_progress(self, description: str = None, silent: bool = False,
+                      analysis: Optional[Dict] = None, auto_branch: bool = True) -> bool:
+        """Save current progress with intelligent branching.
+        
+        Callers that already ran analyze_branch_need() can pass its result,
+        and pass auto_branch=False if they made the branching decision themselves.
+        """
         try:
+            # One analysis serves both the branching decision and the save;
+            # creating a branch does not change the working tree it describes
+            if analysis is None:
+                analysis = self.analyze_branch_need()
+            files = analysis['files']
+            diff_stats = analysis['diff_stats']
+            
             # First check if we should branch
-            if self.auto_branch_if_needed(silent=silent):
+            if auto_branch and self._auto_branch_from_analysis(analysis, silent=silent):
                 if not silent:
                     print("🌿 Auto-created branch for significant changes")
             
-            # Get current status
-            files = self._get_git_status()
-            diff_stats = self._get_diff_stats()
-            
             # Check if there are any changes to save
-            total_files = len(files['modified']) + len(files['added']) + len(files['untracked'])
+            total_files = files['total_files']
             if total_files == 0:
                 if not silent:
                     print("💾 No changes to save.")
@@ -356,11 +627,14 @@ class GitVibeBrancher:
             if not description:
                 description = self._generate_simple_commit_message(files, diff_stats)
             
-            # Stage all changes
-            self._run_git_command(['add', '.'])
-            
-            # Save progress
-            self._run_git_command(['commit', '-m', description])
+            # Save progress; `commit -a` stages tracked changes itself, so a
+            # separate `git add` is only needed to pick up untracked files
+            # (which status does not report when include_untracked is off)
+            if files['untracked'] or not self._include_untracked:
+                self._run_git_command(['add', '.'])
+                self._run_git_command(['commit', '-m', description])
+            else:
+                self._run_git_command(['commit', '-a', '-m', description])
             if not silent:
                 print(f"💾 Progress saved: {description}")
             return True
@@ -376,56 +650,71 @@ class GitVibeBrancher:
     
     def _generate_simple_commit_message(self, files: Dict, diff_stats: Dict) -> str:
         """Generate a simple commit message based on changes."""
-        total_files = len(files['modified']) + len(files['added']) + len(files['untracked'])
+        total_files = files['total_files']
         total_insertions = diff_stats['staged']['insertions'] + diff_stats['unstaged']['insertions']
         total_deletions = diff_stats['staged']['deletions'] + diff_stats['unstaged']['deletions']
         
         # Simple message based on file count
         if total_files == 1:
             main_file = (files['modified'] + files['added'] + files['untracked'])[0]
-            return f"update {Path(main_file).stem}"
+            return f"update {_stem(main_file)}"
         else:
             return f"update {total_files} files"
     
     def _get_branch_info(self, branch_name: str = None) -> Dict:
         """Get information about a branch."""
+        if self._repo is not None:
+            return self._get_branch_info_in_process(branch_name)
+        
+        # The queries are independent, so they run in parallel;
+        # HEAD stands in for the current branch until its name comes back
+        ref = branch_name or 'HEAD'
+        commands = [
+            # Branch creation time (oldest root commit reachable from the branch)
+            ['log', '--max-parents=0', '--format=%ct', ref],
+            # Number of commits on branch
+            ['rev-list', '--count', ref],
+            # Last commit time
+            ['log', '-1', '--format=%ct', ref],
+            # Whether the branch is up to date with main (exit status only)
+            ['merge-base', '--is-ancestor', 'main', ref],
+        ]
         if not branch_name:
-            branch_name = self._run_git_command(['branch', '--show-current'])
+            commands.append(['branch', '--show-current'])
         
-        try:
-            # Get branch creation time (first commit on branch)
-            first_commit = self._run_git_command(['log', '--oneline', '--reverse', branch_name])
-            if first_commit:
-                first_commit_hash = first_commit.split()[0]
-                timestamp_str = self._run_git_command(['log', '-1', '--format=%ct', first_commit_hash])
-                if timestamp_str:
-                    creation_time = datetime.fromtimestamp(int(timestamp_str))
-                else:
-                    creation_time = None
-            else:
-                creation_time = None
-            
-            # Get number of commits on branch
-            commit_count = len(self._run_git_command(['log', '--oneline', branch_name]).split('\n'))
-            
-            # Get last commit time
-            last_commit_time = self._get_last_commit_time()
-            
-            # Check if branch is up to date with main
-            try:
-                self._run_git_command(['merge-base', '--is-ancestor', 'main', branch_name])
-                is_behind_main = False
-            except RuntimeError:
-                is_behind_main = True
-            
+        outputs = self._run_git_commands_parallel(commands)
+        root_timestamps, commit_count, last_timestamp, up_to_date = outputs[:4]
+        if not branch_name:
+            branch_name = outputs[4] or ''
+        
+        if commit_count is None:
             return {
                 'name': branch_name,
-                'creation_time': creation_time,
-                'last_commit_time': last_commit_time,
-                'commit_count': commit_count,
-                'is_behind_main': is_behind_main
+                'creation_time': None,
+                'last_commit_time': None,
+                'commit_count': 0,
+                'is_behind_main': True
             }
-        except RuntimeError:
+        
+        return {
+            'name': branch_name,
+            'creation_time': int(root_timestamps.split('\n')[-1]) if root_timestamps else None,
+            'last_commit_time': int(last_timestamp) if last_timestamp else None,
+            'commit_count': int(commit_count or 0),
+            'is_behind_main': up_to_date is None
+        }
+    
+    def _get_branch_info_in_process(self, branch_name: Optional[str]) -> Dict:
+        """Get information about a branch by walking its history with pygit2."""
+        repo = self._repo
+        if not branch_name:
+            # Like `git branch --show-current`: empty when detached, the name even when unborn
+            head_target = repo.references['HEAD'].target
+            branch_name = '' if repo.head_is_detached else head_target[len('refs/heads/'):]
+        
+        try:
+            tip = repo.revparse_single(branch_name or 'HEAD').peel(pygit2.Commit)
+        except (KeyError, ValueError, pygit2.GitError):
             return {
                 'name': branch_name,
                 'creation_time': None,
@@ -433,6 +722,28 @@ class GitVibeBrancher:
                 'commit_count': 0,
                 'is_behind_main': True
             }
+        
+        # One walk gives both the commit count and the oldest root commit
+        commit_count = 0
+        creation_time = None
+        for commit in repo.walk(tip.id):
+            commit_count += 1
+            if not commit.parent_ids and (creation_time is None or commit.commit_time < creation_time):
+                creation_time = commit.commit_time
+        
+        try:
+            main_id = repo.revparse_single('main').peel(pygit2.Commit).id
+            up_to_date = main_id == tip.id or repo.descendant_of(tip.id, main_id)
+        except (KeyError, ValueError, pygit2.GitError):
+            up_to_date = False
+        
+        return {
+            'name': branch_name,
+            'creation_time': creation_time,
+            'last_commit_time': tip.commit_time,
+            'commit_count': commit_count,
+            'is_behind_main': not up_to_date
+        }
     
     def analyze_branch_convergence(self, branch_name: str = None) -> Dict:
         """Analyze if a branch is ready to be merged back to main."""
@@ -445,8 +756,8 @@ class GitVibeBrancher:
         reasons = []
         
         # Time-based factors
-        if branch_info['creation_time']:
-            age_hours = (datetime.now() - branch_info['creation_time']).total_seconds() / 3600
+        if branch_info['creation_time'] is not None:
+            age_hours = (time.time() - branch_info['creation_time']) / 3600
             
             # Older branches are more likely to be ready
             if age_hours > 24:  # More than 1 day
@@ -466,9 +777,8 @@ class GitVibeBrancher:
             reasons.append(f"Has {commit_count} commits - significant feature")
         
         # Stability factors (no recent commits)
-        if branch_info['last_commit_time']:
-            time_since_last = datetime.now() - branch_info['last_commit_time']
-            hours_since_last = time_since_last.total_seconds() / 3600
+        if branch_info['last_commit_time'] is not None:
+            hours_since_last = (time.time() - branch_info['last_commit_time']) / 3600
             
             if hours_since_last > 2:  # No commits for 2+ hours
                 convergence_score += 0.2
@@ -484,7 +794,7 @@ class GitVibeBrancher:
         
         # Check current changes (if any)
         current_files = self._get_git_status()
-        total_current_files = len(current_files['modified']) + len(current_files['added']) + len(current_files['untracked'])
+        total_current_files = current_files['total_files']
         
         if total_current_files == 0:
             convergence_score += 0.3
@@ -576,13 +886,12 @@ class GitVibeBrancher:
             print(f"  • Branch: {branch_info['name']}")
             print(f"  • Commits: {branch_info['commit_count']}")
             
-            if branch_info['creation_time']:
-                age_hours = (datetime.now() - branch_info['creation_time']).total_seconds() / 3600
+            if branch_info['creation_time'] is not None:
+                age_hours = (time.time() - branch_info['creation_time']) / 3600
                 print(f"  • Age: {age_hours:.1f} hours")
             
-            if branch_info['last_commit_time']:
-                time_since_last = datetime.now() - branch_info['last_commit_time']
-                hours_since_last = time_since_last.total_seconds() / 3600
+            if branch_info['last_commit_time'] is not None:
+                hours_since_last = (time.time() - branch_info['last_commit_time']) / 3600
                 print(f"  • Last commit: {hours_since_last:.1f} hours ago")
             
             print(f"  • Behind main: {'Yes' if branch_info['is_behind_main'] else 'No'}")
@@ -17,6 +17,44 @@ import argparse
 sys.path.append(str(Path(__file__).parent))
 from vibe_brancher import GitVibeBrancher
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+
+class _ChangeCounter(FileSystemEventHandler):
+    """Count filesystem changes in the working tree, ignoring git's own writes and ignored paths."""
+    
+    def __init__(self, repo_path: str, ignored_dirs=()):
+        super().__init__()
+        self.repo_path = repo_path
+        # Trailing separators so 'build' does not also swallow 'builder'
+        self.skipped = tuple(os.path.join(repo_path, d, '') for d in ('.git',) + tuple(ignored_dirs))
+        self.on_new_dir = None
+        self.count = 0
+    
+    def _count(self, event):
+        path = event.src_path
+        if (path + os.sep).startswith(self.skipped):
+            return
+        self.count += 1
+    
+    def on_created(self, event):
+        self._count(event)
+        # The root is watched non-recursively, so new top-level directories need their own watch
+        if (event.is_directory and self.on_new_dir is not None
+                and os.path.dirname(event.src_path) == self.repo_path
+                and not (event.src_path + os.sep).startswith(self.skipped)):
+            try:
+                self.on_new_dir(event.src_path)
+            except OSError:
+                pass  # Out of watches; the directory's later edits go unseen until restart
+    
+    on_deleted = on_modified = on_moved = _count
+
 
 class VibeDaemon:
     def __init__(self, repo_path: str = None, config_path: str = None, 
@@ -34,8 +72,13 @@ class VibeDaemon:
         self.monitor_interval = monitor_interval
         self.auto_commit_interval = auto_commit_interval
         self.running = False
-        self.last_commit_time = datetime.now()
+        # Scheduling uses monotonic seconds; wall-clock time is only for display
+        self.last_commit_time = time.monotonic()
+        self.last_convergence_check = time.monotonic()
         self.last_file_check = {}
+        self._change_count = None
+        self._observer = None
+        self._changes = None
         
         # Initialize the brancher
         try:
@@ -58,15 +101,17 @@ class VibeDaemon:
     def _get_file_modification_times(self) -> Dict[str, float]:
         """Get modification times for all tracked files."""
         try:
-            # Get list of tracked files
-            result = self.brancher._run_git_command(['ls-files'])
+            # Get list of tracked files (NUL-separated, so paths need no unquoting)
+            result = self.brancher._run_git_command(['ls-files', '-z'])
             files = {}
             
-            for file_path in result.split('\n'):
-                if file_path.strip():
-                    full_path = os.path.join(self.brancher.repo_path, file_path)
-                    if os.path.exists(full_path):
-                        files[file_path] = os.path.getmtime(full_path)
+            for file_path in result.split('\0'):
+                if file_path:
+                    # One stat per file; deleted files simply drop out
+                    try:
+                        files[file_path] = os.stat(os.path.join(self.brancher.repo_path, file_path)).st_mtime
+                    except OSError:
+                        continue
             
             return files
         except Exception:
@@ -74,43 +119,53 @@ class VibeDaemon:
     
     def _check_for_changes(self) -> bool:
         """Check if any files have been modified since last check."""
+        if self._changes is not None:
+            # The watcher already counted changes; no need to stat anything
+            changed = self._change_count is not None and self._change_count != self._changes.count
+            self._change_count = self._changes.count
+            return changed
+        
         current_files = self._get_file_modification_times()
         
         if not self.last_file_check:
             self.last_file_check = current_files
             return False
         
-        # Check if any files have been modified
-        for file_path, mtime in current_files.items():
-            if file_path not in self.last_file_check or self.last_file_check[file_path] != mtime:
-                self.last_file_check = current_files
-                return True
+        # Nothing was touched since last tick (the common case); dict equality runs in C
+        if current_files == self.last_file_check:
+            return False
         
-        return False
+        # Check if any files have been modified
+        changed = any(self.last_file_check.get(file_path) != mtime
+                      for file_path, mtime in current_files.items())
+        self.last_file_check = current_files
+        return changed
     
     def _should_auto_commit(self) -> bool:
         """Determine if it's time for an automatic commit."""
-        time_since_last = datetime.now() - self.last_commit_time
-        return time_since_last.total_seconds() >= self.auto_commit_interval
+        return time.monotonic() - self.last_commit_time >= self.auto_commit_interval
     
-    def _auto_save_if_needed(self):
-        """Perform automatic save if conditions are met."""
+    def _auto_save_if_needed(self, analysis: Optional[Dict] = None):
+        """Perform automatic save if conditions are met.
+        
+        A tick that already analysed the repository passes that analysis in.
+        """
         try:
-            # Check if there are any changes
-            files = self.brancher._get_git_status()
-            total_files = len(files['modified']) + len(files['added']) + len(files['untracked'])
-            
-            if total_files == 0:
+            # Check if we should auto-save based on time (no git calls needed)
+            if not self._should_auto_commit():
                 return
             
-            # Check if we should auto-save based on time
-            if not self._should_auto_commit():
+            # Otherwise check the repository itself rather than trusting mtimes:
+            # new untracked files and manual commits leave tracked-file mtimes alone
+            if analysis is None:
+                analysis = self.brancher.analyze_branch_need()
+            if analysis['files']['total_files'] == 0:
                 return
             
             # Perform automatic save with branching (completely silent)
-            success = self.brancher.save_progress(silent=True)
+            success = self.brancher.save_progress(silent=True, analysis=analysis)
             if success:
-                self.last_commit_time = datetime.now()
+                self.last_commit_time = time.monotonic()
                 # Only show minimal feedback, don't interrupt flow
                 print(f"💾 Auto-saved at {datetime.now().strftime('%H:%M')}")
             
@@ -122,11 +177,7 @@ class VibeDaemon:
         """Check if current branch is ready to merge."""
         try:
             # Only check convergence every 10 minutes to avoid overhead
-            if not hasattr(self, 'last_convergence_check'):
-                self.last_convergence_check = datetime.now()
-            
-            time_since_check = datetime.now() - self.last_convergence_check
-            if time_since_check.total_seconds() < 600:  # 10 minutes
+            if time.monotonic() - self.last_convergence_check < 600:  # 10 minutes
                 return
             
             # Run convergence analysis
@@ -138,7 +189,7 @@ class VibeDaemon:
                 strategy = self.brancher.suggest_merge_strategy()
                 print(f"   Suggested: {strategy}")
             
-            self.last_convergence_check = datetime.now()
+            self.last_convergence_check = time.monotonic()
             
         except Exception:
             # Silent failure
@@ -154,6 +205,7 @@ class VibeDaemon:
         while self.running:
             try:
                 # Check for file changes
+                analysis = None
                 if self._check_for_changes():
                     print(f"📝 Files changed at {datetime.now().strftime('%H:%M:%S')}")
                     
@@ -162,8 +214,8 @@ class VibeDaemon:
                     if analysis['should_branch']:
                         print(f"🌿 Branch score: {analysis['branch_score']:.2f} - considering auto-branch")
                 
-                # Check for auto-save
-                self._auto_save_if_needed()
+                # Check for auto-save, reusing this tick's analysis if there was one
+                self._auto_save_if_needed(analysis)
                 
                 # Check branch convergence (every 10 minutes)
                 self._check_branch_convergence()
@@ -179,10 +231,64 @@ class VibeDaemon:
         
         print("🛑 Vibe daemon stopped")
     
+    def _get_ignored_dirs(self) -> list:
+        """List the working tree directories git ignores wholesale (build output, virtualenvs, ...)."""
+        try:
+            output = self.brancher._run_git_command(
+                ['ls-files', '-z', '--others', '--ignored', '--exclude-standard', '--directory'])
+        except RuntimeError:
+            return []
+        return [path.rstrip('/') for path in output.split('\0') if path.endswith('/')]
+    
+    def _start_watching(self):
+        """Watch the working tree for changes if watchdog is installed."""
+        if Observer is None:
+            return
+        
+        # Event paths come back normalised, so match them against a normalised root
+        repo_path = os.path.normpath(os.path.abspath(self.brancher.repo_path))
+        ignored_dirs = self._get_ignored_dirs()
+        changes = _ChangeCounter(repo_path, ignored_dirs)
+        observer = Observer()
+        
+        def watch_dir(path):
+            observer.schedule(changes, path, recursive=True)
+        
+        try:
+            # Watch the root itself, then each top-level directory that is not ignored,
+            # so large ignored trees never cost inotify watches
+            observer.schedule(changes, repo_path, recursive=False)
+            skipped = {'.git'}.union(d for d in ignored_dirs if '/' not in d)
+            for entry in os.scandir(repo_path):
+                if entry.is_dir(follow_symlinks=False) and entry.name not in skipped:
+                    watch_dir(entry.path)
+            changes.on_new_dir = watch_dir
+            observer.start()
+        except OSError as e:
+            # Typically the inotify watch limit; stat polling still works
+            observer.stop()
+            print(f"⚠️  File watching unavailable ({e}); falling back to polling")
+            return
+        
+        self._changes = changes
+        self._observer = observer
+    
+    def _stop_watching(self):
+        """Stop the filesystem watcher, if one is running."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+            self._changes = None
+    
     def start(self):
         """Start the daemon."""
         self.running = True
-        self._monitor_loop()
+        self._start_watching()
+        try:
+            self._monitor_loop()
+        finally:
+            self._stop_watching()
     
     def stop(self):
         """Stop the daemon."""